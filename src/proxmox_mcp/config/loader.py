@@ -21,6 +21,13 @@ from typing import Any, Dict, Optional
 from ..utils.encryption import TokenEncryption
 from .models import Config
 
+try:
+    import orjson  # type: ignore[import]
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def load_config(config_path: Optional[str] = None) -> Config:
     """Load and validate configuration from a JSON file.
@@ -72,6 +79,11 @@ def _resolve_config_path(config_path: Optional[str]) -> str:
 def _load_json_config(path: str) -> Any:
     """Load and parse JSON configuration from file."""
     try:
+        # orjson parses in C when available; its JSONDecodeError subclasses
+        # the stdlib one, so the handler below covers both parsers
+        if ORJSON_AVAILABLE:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
         with open(path) as f:
             return json.load(f)
     except json.JSONDecodeError as e:
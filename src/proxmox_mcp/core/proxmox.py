@@ -16,6 +16,8 @@ import logging
 from typing import Any, Dict
 
 from proxmoxer import ProxmoxAPI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config.models import AuthConfig, ProxmoxConfig
 from ..exceptions import map_proxmox_error
@@ -96,6 +98,7 @@ class ProxmoxManager:
         try:
             self.logger.info(f"Connecting to Proxmox host: {self.config['host']}")
             api = ProxmoxAPI(**self.config)
+            self._configure_connection_pooling(api)
 
             # Test connection
             api.version.get()
@@ -117,6 +120,41 @@ class ProxmoxManager:
             )
             raise mapped_exception from e
 
+    def _configure_connection_pooling(self, api: ProxmoxAPI) -> None:
+        """Enable HTTP keep-alive connection pooling on the API session.
+
+        Proxmoxer's HTTPS backend uses a ``requests.Session`` under the hood,
+        but with default adapter settings every burst of concurrent calls can
+        exhaust the small connection pool and fall back to new TLS handshakes.
+        Operations like ``execute_vm_command`` make several round-trips per
+        call (status check, agent exec, exec-status), so reusing pooled
+        connections amortizes the TLS handshake cost across all API traffic.
+
+        Mounts an ``HTTPAdapter`` with a larger connection pool and a small
+        retry budget for transient transport errors onto the session that
+        proxmoxer created for this API instance.
+
+        The pooling only pays off because ``get_api()`` hands the same
+        ProxmoxAPI instance (and therefore the same session) to every tool;
+        constructing a fresh ProxmoxAPI per request would discard the warm
+        pool and pay the TLS handshake again on every call.
+
+        Args:
+            api: ProxmoxAPI instance whose session should be configured
+        """
+        session = api._store.get("session")
+        if session is None:
+            self.logger.warning("Proxmox API session unavailable; skipping connection pooling")
+            return
+
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1),
+        )
+        session.mount("https://", adapter)
+        self.logger.debug("Configured pooled HTTPAdapter on Proxmox API session")
+
     def get_api(self) -> ProxmoxAPI:
         """Get the initialized Proxmox API instance.
 
@@ -11,6 +11,10 @@ from .theme import ProxmoxTheme
 class ProxmoxFormatters:
     """Core formatting functions for Proxmox data."""
 
+    # Precomputed (threshold, unit) table so unit selection is a handful of
+    # comparisons with a single division, instead of repeated divide-and-loop
+    _BYTE_UNITS = ((1 << 40, "TB"), (1 << 30, "GB"), (1 << 20, "MB"), (1 << 10, "KB"))
+
     @staticmethod
     def format_bytes(bytes_value: int) -> str:
         """Format bytes with proper units.
@@ -21,12 +25,10 @@ class ProxmoxFormatters:
         Returns:
             Formatted string with appropriate unit
         """
-        value: float = float(bytes_value)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if value < 1024:
-                return f"{value:.2f} {unit}"
-            value /= 1024
-        return f"{value:.2f} TB"
+        for threshold, unit in ProxmoxFormatters._BYTE_UNITS:
+            if bytes_value >= threshold:
+                return f"{bytes_value / threshold:.2f} {unit}"
+        return f"{float(bytes_value):.2f} B"
 
     @staticmethod
     def format_uptime(seconds: int) -> str:
@@ -144,16 +146,19 @@ class ProxmoxFormatters:
         Returns:
             Formatted command output string
         """
-        result = [
-            f"{ProxmoxTheme.ACTIONS['command']} Console Command Result",
-            f"  • Status: {'SUCCESS' if success else 'FAILED'}",
-            f"  • Command: {command}",
-            "",
-            "Output:",
-            output.strip(),
-        ]
+        # Built as one f-string: this runs once per executed command, so
+        # skipping the intermediate list + join keeps the response path to
+        # a single string allocation
+        result = (
+            f"{ProxmoxTheme.ACTIONS['command']} Console Command Result\n"
+            f"  • Status: {'SUCCESS' if success else 'FAILED'}\n"
+            f"  • Command: {command}\n"
+            "\n"
+            "Output:\n"
+            f"{output.strip()}"
+        )
 
         if error:
-            result.extend(["", "Error:", error.strip()])
+            return f"{result}\n\nError:\n{error.strip()}"
 
-        return "\n".join(result)
+        return result
@@ -15,6 +15,7 @@ The server exposes a set of tools for managing Proxmox resources including:
 - Cluster status monitoring
 """
 
+import asyncio
 import os
 import signal
 import sys
@@ -90,28 +91,31 @@ class ProxmoxMCPServer:
         """
 
         # Node tools
+        # Listing tools run blocking proxmoxer I/O, so they are registered as
+        # coroutines that offload to a worker thread and keep the event loop
+        # free to serve other MCP requests concurrently
         @self.mcp.tool(description=GET_NODES_DESC)
-        def get_nodes() -> List[TextContent]:
-            return self.node_tools.get_nodes()
+        async def get_nodes() -> List[TextContent]:
+            return await asyncio.to_thread(self.node_tools.get_nodes)
 
         @self.mcp.tool(description=GET_NODE_STATUS_DESC)
-        def get_node_status(
+        async def get_node_status(
             node: Annotated[
                 str,
                 Field(description="Name/ID of node to query (e.g. 'pve1', 'proxmox-node2')"),
             ],
         ) -> List[TextContent]:
-            return self.node_tools.get_node_status(node)
+            return await asyncio.to_thread(self.node_tools.get_node_status, node)
 
         # VM tools
         @self.mcp.tool(description=GET_VMS_DESC)
-        def get_vms() -> List[TextContent]:
-            return self.vm_tools.get_vms()
+        async def get_vms() -> List[TextContent]:
+            return await asyncio.to_thread(self.vm_tools.get_vms)
 
         # Container tools
         @self.mcp.tool(description=GET_CONTAINERS_DESC)
-        def get_containers() -> List[TextContent]:
-            return self.container_tools.get_containers()
+        async def get_containers() -> List[TextContent]:
+            return await asyncio.to_thread(self.container_tools.get_containers)
 
         @self.mcp.tool(description=EXECUTE_VM_COMMAND_DESC)
         async def execute_vm_command(
@@ -130,13 +134,13 @@ class ProxmoxMCPServer:
 
         # Storage tools
         @self.mcp.tool(description=GET_STORAGE_DESC)
-        def get_storage() -> List[TextContent]:
-            return self.storage_tools.get_storage()
+        async def get_storage() -> List[TextContent]:
+            return await asyncio.to_thread(self.storage_tools.get_storage)
 
         # Cluster tools
         @self.mcp.tool(description=GET_CLUSTER_STATUS_DESC)
-        def get_cluster_status() -> List[TextContent]:
-            return self.cluster_tools.get_cluster_status()
+        async def get_cluster_status() -> List[TextContent]:
+            return await asyncio.to_thread(self.cluster_tools.get_cluster_status)
 
         # AI Diagnostic tools
         @self.mcp.tool(description=ANALYZE_CLUSTER_HEALTH_DESC)
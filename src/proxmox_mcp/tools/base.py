@@ -11,8 +11,12 @@ All tool implementations inherit from the ProxmoxTool base class to ensure
 consistent behavior and error handling across the MCP server.
 """
 
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+import json
 import logging
-from typing import Any, Callable, Dict, List, Optional
+import time
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
 
 from mcp.types import TextContent as Content
 from proxmoxer import ProxmoxAPI
@@ -20,6 +24,13 @@ from proxmoxer import ProxmoxAPI
 from ..exceptions import ProxmoxMCPError, map_proxmox_error
 from ..formatting import ProxmoxTemplates
 
+try:
+    import orjson  # type: ignore[import]
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ProxmoxTool:
     """Base class for Proxmox MCP tools with structured exception handling.
@@ -34,6 +45,18 @@ class ProxmoxTool:
     behavior and error handling across the MCP server.
     """
 
+    # Cluster listings (nodes, storage pools, cluster status) change on
+    # minute scales, so identical queries within this window are served
+    # from cache instead of re-hitting the Proxmox API
+    _LIST_CACHE_TTL = 30.0
+
+    # Shared thread pool for fanning out blocking proxmoxer calls. One
+    # process-wide pool avoids paying thread startup/teardown on every
+    # listing call and mirrors the connection-pool reuse on the HTTP side.
+    _IO_EXECUTOR: ClassVar[ThreadPoolExecutor] = ThreadPoolExecutor(
+        max_workers=32, thread_name_prefix="proxmox-io"
+    )
+
     def __init__(self, proxmox_api: ProxmoxAPI):
         """Initialize the tool.
 
@@ -42,6 +65,34 @@ class ProxmoxTool:
         """
         self.proxmox = proxmox_api
         self.logger = logging.getLogger(f"proxmox-mcp.{self.__class__.__name__.lower()}")
+        self._list_cache: Dict[str, Tuple[float, Any]] = {}
+
+    def _cached_list(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Return a cached API listing, refreshing it after the TTL expires.
+
+        Args:
+            key: Cache key identifying the listing (e.g. "nodes", "storage")
+            fetch: Zero-argument callable performing the actual API call
+
+        Returns:
+            The cached or freshly fetched listing data
+        """
+        cached = self._list_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._LIST_CACHE_TTL:
+            return cached[1]
+
+        data = fetch()
+        self._list_cache[key] = (now, data)
+        return data
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached listings, forcing fresh API queries.
+
+        Intended for write-path tools to call after state-changing
+        operations so subsequent listings reflect the new state.
+        """
+        self._list_cache.clear()
 
     def _format_response(self, data: Any, resource_type: Optional[str] = None) -> List[Content]:
         """Format response data into MCP content using templates.
@@ -87,9 +138,10 @@ class ProxmoxTool:
         if resource_type in template_mapping:
             return template_mapping[resource_type](data)
 
-        # Fallback to JSON formatting for unknown types
-        import json
-
+        # Fallback to JSON formatting for unknown types; orjson serializes
+        # straight to UTF-8 bytes in C when available
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(data, indent=2)
 
     def _format_node_status(self, data: Any) -> str:
@@ -151,3 +203,8 @@ class ProxmoxTool:
         )
 
         raise mapped_exception from error
+
+
+# Let in-flight API calls finish quickly at interpreter shutdown without
+# blocking on stragglers
+atexit.register(ProxmoxTool._IO_EXECUTOR.shutdown, wait=False)
@@ -67,7 +67,7 @@ class ClusterTools(ProxmoxTool):
                         - API endpoint failures
         """
         try:
-            result = self.proxmox.cluster.status.get()
+            result = self._cached_list("cluster_status", self.proxmox.cluster.status.get)
             status = {
                 "name": result[0].get("name") if result else None,
                 "quorum": result[0].get("quorate"),
@@ -16,14 +16,45 @@ The module implements a robust and secure command execution system with:
 - Comprehensive error handling with structured exceptions
 """
 
+import asyncio
+from dataclasses import dataclass
 import logging
 import os
 from typing import Any
 
-from ...exceptions import ProxmoxResourceUnavailableError, ProxmoxSecurityError, map_proxmox_error
+from ...exceptions import (
+    ProxmoxMCPError,
+    ProxmoxResourceUnavailableError,
+    ProxmoxSecurityError,
+    map_proxmox_error,
+)
 from .security import CommandSecurityError, SecurityPolicy, VMCommandSecurityValidator
 
 
+@dataclass(slots=True)
+class ExecResult:
+    """Fixed-shape result of a VM command execution.
+
+    A slotted record keeps the per-execution result allocation compact and
+    gives downstream consumers a stable field layout. Converted to the
+    documented dict form only at the public ``execute_command`` boundary.
+    """
+
+    success: bool
+    output: str
+    error: str
+    exit_code: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dict representation used by the public API."""
+        return {
+            "success": self.success,
+            "output": self.output,
+            "error": self.error,
+            "exit_code": self.exit_code,
+        }
+
+
 class VMConsoleManager:
     """Manager class for VM console operations.
 
@@ -40,15 +71,30 @@ class VMConsoleManager:
     - Comprehensive error handling
     """
 
-    def __init__(self, proxmox_api: Any) -> None:
+    def __init__(
+        self,
+        proxmox_api: Any,
+        security_validator: VMCommandSecurityValidator | None = None,
+    ) -> None:
         """Initialize the VM console manager with security validation.
 
         Args:
             proxmox_api: Initialized ProxmoxAPI instance
+            security_validator: Optional pre-configured validator. When omitted,
+                a validator is built from the PROXMOX_MCP_SECURITY_POLICY
+                environment variable (defaulting to the standard policy).
         """
         self.proxmox = proxmox_api
         self.logger = logging.getLogger("proxmox-mcp.vm-console")
 
+        if security_validator is not None:
+            self.security_validator = security_validator
+            self.logger.info(
+                f"VM console security initialized with injected "
+                f"{security_validator.policy.value} policy validator"
+            )
+            return
+
         # Initialize security validator with policy from environment
         security_policy = os.environ.get("PROXMOX_MCP_SECURITY_POLICY", "standard")
         try:
@@ -89,12 +135,18 @@ class VMConsoleManager:
 
         try:
             self.logger.debug(f"Executing command via agent: {command}")
-            exec_result = endpoint("exec").post(command=command)
+            # Offload the blocking HTTPS call so the event loop stays responsive
+            exec_result = await asyncio.to_thread(endpoint("exec").post, command=command)
             self.logger.debug(f"Raw exec response: {exec_result}")
             self.logger.info(f"Command started with result: {exec_result}")
         except Exception as e:
-            self.logger.error(f"Failed to start command: {str(e)}")
-            raise RuntimeError(f"Failed to start command: {str(e)}") from e
+            self.logger.error(f"Failed to start command: {e}")
+            # Map at the leaf so the outer handler doesn't re-wrap
+            mapped_exception = map_proxmox_error(
+                error=e, operation="agent_exec", resource_type="vm", resource_id=vmid
+            )
+            mapped_exception.context["node"] = node
+            raise mapped_exception from e
 
         if "pid" not in exec_result:
             raise RuntimeError("No PID returned from command execution")
@@ -106,58 +158,61 @@ class VMConsoleManager:
 
     async def _get_command_results(self, node: str, vmid: str, pid: int) -> dict[str, Any]:
         """Wait for command completion and get results."""
-        import asyncio
-
         self.logger.info(f"Waiting for command completion (PID: {pid})...")
         await asyncio.sleep(1)  # Allow command to complete
 
         endpoint = self.proxmox.nodes(node).qemu(vmid).agent
         try:
             self.logger.debug(f"Getting status for PID {pid}...")
-            console = endpoint("exec-status").get(pid=pid)
+            console = await asyncio.to_thread(endpoint("exec-status").get, pid=pid)
             self.logger.debug(f"Raw exec-status response: {console}")
             if not console:
                 raise RuntimeError("No response from exec-status")
         except Exception as e:
-            self.logger.error(f"Failed to get command status: {str(e)}")
-            raise RuntimeError(f"Failed to get command status: {str(e)}") from e
+            self.logger.error(f"Failed to get command status: {e}")
+            mapped_exception = map_proxmox_error(
+                error=e, operation="agent_exec_status", resource_type="vm", resource_id=vmid
+            )
+            mapped_exception.context["node"] = node
+            raise mapped_exception from e
 
         self.logger.info(f"Command completed with status: {console}")
         if not isinstance(console, dict):
             raise RuntimeError(f"Expected dict response, got {type(console).__name__}: {console!r}")
         return console
 
-    def _process_command_response(self, console: Any) -> dict[str, Any]:
+    def _process_command_response(self, console: Any) -> ExecResult:
         """Process and format command execution response."""
-        self.logger.debug(f"Raw API response type: {type(console)}")
-        self.logger.debug(f"Raw API response: {console}")
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            self.logger.debug(f"Raw API response type: {type(console)}")
+            self.logger.debug(f"Raw API response: {console}")
 
         if isinstance(console, dict):
-            # Handle exec-status response format
-            output = console.get("out-data", "")
-            error = console.get("err-data", "")
-            exit_code = console.get("exitcode", 0)
-            exited = console.get("exited", 0)
+            # Handle exec-status response format; bind .get once for the
+            # repeated lookups on the same dict
+            get = console.get
+            output = get("out-data", "")
+            error = get("err-data", "")
+            exit_code = get("exitcode", 0)
+            exited = get("exited", 0)
 
             if not exited:
                 self.logger.warning("Command may not have completed")
         else:
             # Some versions might return data differently
-            self.logger.debug(f"Unexpected response type: {type(console)}")
+            if debug_enabled:
+                self.logger.debug(f"Unexpected response type: {type(console)}")
             output = str(console)
             error = ""
             exit_code = 0
 
-        self.logger.debug(f"Processed output: {output}")
-        self.logger.debug(f"Processed error: {error}")
-        self.logger.debug(f"Processed exit code: {exit_code}")
+        if debug_enabled:
+            self.logger.debug(f"Processed output: {output}")
+            self.logger.debug(f"Processed error: {error}")
+            self.logger.debug(f"Processed exit code: {exit_code}")
 
-        return {
-            "success": True,
-            "output": output,
-            "error": error,
-            "exit_code": exit_code,
-        }
+        return ExecResult(success=True, output=output, error=error, exit_code=exit_code)
 
     async def execute_command(self, node: str, vmid: str, command: str) -> dict[str, Any]:
         """
@@ -228,7 +283,8 @@ class VMConsoleManager:
                     },
                 ) from e
 
-            self._validate_vm_for_execution(node, vmid)
+            # Offload the blocking status check so concurrent commands overlap
+            await asyncio.to_thread(self._validate_vm_for_execution, node, vmid)
 
             pid = await self._execute_command_via_agent(node, vmid, command)
 
@@ -238,19 +294,19 @@ class VMConsoleManager:
 
             self._log_command_success(node, vmid, command)
 
-            return result
+            return result.to_dict()
 
-        except (ProxmoxSecurityError, ProxmoxResourceUnavailableError):
-            # Re-raise structured exceptions without modification
+        except ProxmoxMCPError:
+            # Already-mapped structured exceptions propagate without re-mapping
             raise
         except Exception as e:
             # Map generic exceptions to structured ProxmoxMCP exceptions
             mapped_exception = map_proxmox_error(
                 error=e, operation="execute_vm_command", resource_type="vm", resource_id=vmid
             )
-            mapped_exception.context.update(
-                {"node": node, "command": command[:50] + "..." if len(command) > 50 else command}
-            )
+            # Slice-based truncation avoids scanning the full command length
+            command_preview = command[:50] + ("..." if command[50:51] else "")
+            mapped_exception.context.update({"node": node, "command": command_preview})
             self.logger.error(f"Command execution failed on VM {vmid}: {mapped_exception}")
             raise mapped_exception from e
 
@@ -17,13 +17,38 @@ Security Features:
 The validation is designed to be strict by default while allowing
 administrators to configure appropriate security policies for their
 specific operational requirements.
+
+Performance notes:
+The hot character-scan kernels run through str.maketrans/str.translate
+deletion tables, which execute as C loops inside CPython, so a compiled
+(Cython/Numba) extension would add build complexity without a meaningful
+win. The module is pure Python and also runs unmodified under PyPy,
+where the whole validation pipeline benefits from the JIT.
 """
 
 from enum import Enum
+import functools
 import logging
 import re
 import shlex
-from typing import Dict, List, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick  # type: ignore[import]
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    # google-re2 compiles to a DFA with guaranteed linear-time matching,
+    # which is preferable for an adversary-controlled validation path
+    import re2 as _re_engine  # type: ignore[import]
+
+    RE2_AVAILABLE = True
+except ImportError:
+    _re_engine = re  # type: ignore[assignment]
+    RE2_AVAILABLE = False
 
 
 class SecurityPolicy(Enum):
@@ -37,6 +62,8 @@ class SecurityPolicy(Enum):
 class CommandSecurityError(Exception):
     """Raised when a command fails security validation."""
 
+    __slots__ = ("command", "violation_type", "message")
+
     def __init__(self, message: str, command: str, violation_type: str):
         """Initialize security error with context.
 
@@ -48,6 +75,7 @@ class CommandSecurityError(Exception):
         super().__init__(message)
         self.command = command
         self.violation_type = violation_type
+        self.message = message
 
 
 class VMCommandSecurityValidator:
@@ -70,140 +98,169 @@ class VMCommandSecurityValidator:
             logger.error(f"Security violation: {e}")
     """
 
+    __slots__ = (
+        "policy",
+        "logger",
+        "_injection_regex",
+        "_injection_pattern_by_group",
+        "_injection_trigger_table",
+        "_danger_table",
+        "_allowed_commands",
+        "_allowed_single",
+        "_allowed_prefixes",
+        "_blacklist_automaton",
+        "_allowed_automaton",
+        "_validate_cached",
+        "_log_counter",
+        "_check_dangerous_chars",
+        "_check_whitelist",
+    )
+
+    # Policy-bound dispatch slots: __init__ binds either the real check or
+    # _skip_check, so both bindings must satisfy one declared signature
+    _check_dangerous_chars: Callable[[str], None]
+    _check_whitelist: Callable[[List[str], str, str], None]
+
     # Commands allowed in STRICT mode (most restrictive)
-    STRICT_WHITELIST = {
-        # System information
-        "uname",
-        "hostname",
-        "whoami",
-        "id",
-        "uptime",
-        "date",
-        # File operations (read-only)
-        "ls",
-        "cat",
-        "head",
-        "tail",
-        "find",
-        "grep",
-        "wc",
-        # Process information
-        "ps",
-        "top",
-        "htop",
-        "pgrep",
-        # Network information (read-only)
-        "ping",
-        "traceroute",
-        "netstat",
-        "ss",
-        # Disk information
-        "df",
-        "du",
-        "lsblk",
-        "mount",
-        # Service status (read-only)
-        "systemctl status",
-        "service status",
-    }
+    STRICT_WHITELIST = frozenset(
+        {
+            # System information
+            "uname",
+            "hostname",
+            "whoami",
+            "id",
+            "uptime",
+            "date",
+            # File operations (read-only)
+            "ls",
+            "cat",
+            "head",
+            "tail",
+            "find",
+            "grep",
+            "wc",
+            # Process information
+            "ps",
+            "top",
+            "htop",
+            "pgrep",
+            # Network information (read-only)
+            "ping",
+            "traceroute",
+            "netstat",
+            "ss",
+            # Disk information
+            "df",
+            "du",
+            "lsblk",
+            "mount",
+            # Service status (read-only)
+            "systemctl status",
+            "service status",
+        }
+    )
 
     # Additional commands allowed in STANDARD mode
-    STANDARD_ADDITIONAL = {
-        # Package management (query only)
-        "dpkg",
-        "rpm",
-        "yum list",
-        "apt list",
-        "dnf list",
-        # Log viewing
-        "journalctl",
-        "dmesg",
-        # Configuration viewing
-        "nginx -t",
-        "apache2 -t",
-        "httpd -t",
-        # Database queries (read-only)
-        "mysql",
-        "psql",
-        "redis-cli",
-    }
+    STANDARD_ADDITIONAL = frozenset(
+        {
+            # Package management (query only)
+            "dpkg",
+            "rpm",
+            "yum list",
+            "apt list",
+            "dnf list",
+            # Log viewing
+            "journalctl",
+            "dmesg",
+            # Configuration viewing
+            "nginx -t",
+            "apache2 -t",
+            "httpd -t",
+            # Database queries (read-only)
+            "mysql",
+            "psql",
+            "redis-cli",
+        }
+    )
 
     # Commands that are NEVER allowed (blacklisted)
-    GLOBAL_BLACKLIST = {
-        # System modification
-        "rm",
-        "rmdir",
-        "mv",
-        "cp",
-        "dd",
-        "shred",
-        # Permission changes
-        "chmod",
-        "chown",
-        "chgrp",
-        "setfacl",
-        # User management
-        "useradd",
-        "userdel",
-        "usermod",
-        "passwd",
-        "su",
-        "sudo",
-        # Network modification
-        "iptables",
-        "ufw",
-        "firewall-cmd",
-        "ipset",
-        # Service control
-        "systemctl start",
-        "systemctl stop",
-        "systemctl restart",
-        "systemctl enable",
-        "systemctl disable",
-        "service start",
-        "service stop",
-        "service restart",
-        # Package installation
-        "apt install",
-        "apt remove",
-        "yum install",
-        "yum remove",
-        "dnf install",
-        "dnf remove",
-        "pip install",
-        "npm install",
-        # Dangerous utilities
-        "wget",
-        "curl",
-        "nc",
-        "netcat",
-        "telnet",
-        "ssh",
-        "scp",
-        "rsync",
-        # Shell manipulation
-        "bash",
-        "sh",
-        "zsh",
-        "fish",
-        "exec",
-        "eval",
-        # File editing
-        "vi",
-        "vim",
-        "nano",
-        "emacs",
-        "sed",
-        "awk",
-    }
+    GLOBAL_BLACKLIST = frozenset(
+        {
+            # System modification
+            "rm",
+            "rmdir",
+            "mv",
+            "cp",
+            "dd",
+            "shred",
+            # Permission changes
+            "chmod",
+            "chown",
+            "chgrp",
+            "setfacl",
+            # User management
+            "useradd",
+            "userdel",
+            "usermod",
+            "passwd",
+            "su",
+            "sudo",
+            # Network modification
+            "iptables",
+            "ufw",
+            "firewall-cmd",
+            "ipset",
+            # Service control
+            "systemctl start",
+            "systemctl stop",
+            "systemctl restart",
+            "systemctl enable",
+            "systemctl disable",
+            "service start",
+            "service stop",
+            "service restart",
+            # Package installation
+            "apt install",
+            "apt remove",
+            "yum install",
+            "yum remove",
+            "dnf install",
+            "dnf remove",
+            "pip install",
+            "npm install",
+            # Dangerous utilities
+            "wget",
+            "curl",
+            "nc",
+            "netcat",
+            "telnet",
+            "ssh",
+            "scp",
+            "rsync",
+            # Shell manipulation
+            "bash",
+            "sh",
+            "zsh",
+            "fish",
+            "exec",
+            "eval",
+            # File editing
+            "vi",
+            "vim",
+            "nano",
+            "emacs",
+            "sed",
+            "awk",
+        }
+    )
 
     # Dangerous shell patterns that indicate injection attempts
     INJECTION_PATTERNS = [
         r"[;&|`$()]",  # Shell operators and command substitution
         r"<<|>>",  # Redirection operators
-        r"\${.*}",  # Variable expansion
-        r"`.*`",  # Command substitution
-        r"\$\(.*\)",  # Command substitution
+        r"\$\{[^}]{0,256}\}",  # Variable expansion (bounded, no backtracking)
+        r"`[^`]{0,256}`",  # Command substitution (bounded, no backtracking)
+        r"\$\([^)]{0,256}\)",  # Command substitution (bounded, no backtracking)
         r"\.\./",  # Directory traversal
         r"/dev/",  # Device file access
         r"/proc/",  # Process filesystem access
@@ -213,7 +270,32 @@ class VMCommandSecurityValidator:
     ]
 
     # Characters that are often used in injection attacks
-    DANGEROUS_CHARS = set(";&|`$(){}[]<>*?~")
+    DANGEROUS_CHARS = frozenset(";&|`$(){}[]<>*?~")
+
+    # Reasonable maximum length for most legitimate commands
+    MAX_COMMAND_LENGTH = 1000
+
+    # 256-entry branchless membership table: _DANGER_LOOKUP[ord(c)] is 1 for
+    # dangerous characters (input is ASCII-gated before any lookup)
+    _danger_lookup_builder = bytearray(256)
+    for _danger_char in DANGEROUS_CHARS:
+        _danger_lookup_builder[ord(_danger_char)] = 1
+    _DANGER_LOOKUP = bytes(_danger_lookup_builder)
+    del _danger_lookup_builder, _danger_char
+
+    # Lowercase lookup tiers derived from GLOBAL_BLACKLIST at class load:
+    # single-token commands get O(1) frozenset membership, multi-token entries
+    # become a tuple for a single C-level str.startswith pass
+    _BLACKLIST_SINGLE = frozenset(entry.lower() for entry in GLOBAL_BLACKLIST if " " not in entry)
+    _BLACKLIST_PREFIXES = tuple(sorted(entry.lower() for entry in GLOBAL_BLACKLIST if " " in entry))
+
+    # Every INJECTION_PATTERNS match requires at least one of these characters,
+    # so commands containing none of them can skip the regex scan entirely
+    _INJECTION_TRIGGER_CHARS = "".join(DANGEROUS_CHARS) + "/\\%\x00"
+
+    # Deletion table detecting quote/escape characters in one C-level pass;
+    # commands without them can be split on whitespace instead of via shlex
+    _QUOTE_TABLE = str.maketrans("", "", "'\"\\")
 
     def __init__(self, policy: SecurityPolicy = SecurityPolicy.STANDARD):
         """Initialize the security validator.
@@ -224,13 +306,68 @@ class VMCommandSecurityValidator:
         self.policy = policy
         self.logger = logging.getLogger("proxmox-mcp.security")
 
-        # Compile regex patterns for performance
-        self._injection_regex = [
-            re.compile(pattern, re.IGNORECASE) for pattern in self.INJECTION_PATTERNS
-        ]
+        # Compile all injection patterns into a single alternation so one
+        # C-level scan covers every pattern instead of one pass per pattern
+        # (via RE2's DFA engine when google-re2 is installed)
+        # The inline (?i) flag is used because re2 exposes no flag constants.
+        # Each alternative is a named group so violations can report which
+        # source pattern fired without re-running the patterns individually.
+        self._injection_regex = _re_engine.compile(
+            "(?i)"
+            + "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(self.INJECTION_PATTERNS))
+        )
+        self._injection_pattern_by_group = {
+            f"p{i}": pattern for i, pattern in enumerate(self.INJECTION_PATTERNS)
+        }
+
+        # Deletion table for the cheap pre-screen in _validate_injection_patterns
+        self._injection_trigger_table = str.maketrans("", "", self._INJECTION_TRIGGER_CHARS)
 
-        # Build allowed commands based on policy
+        # Deletion table for the dangerous-character check: translate runs in
+        # C, so the Python-level set intersection only happens on failure
+        self._danger_table = str.maketrans("", "", "".join(self.DANGEROUS_CHARS))
+
+        # Build allowed commands based on policy, split into the same
+        # single-token/prefix tiers as the blacklist
         self._allowed_commands = self._build_allowed_commands()
+        self._allowed_single = frozenset(
+            entry.lower() for entry in self._allowed_commands if " " not in entry
+        )
+        self._allowed_prefixes = tuple(
+            sorted(entry.lower() for entry in self._allowed_commands if " " in entry)
+        )
+
+        # With pyahocorasick installed, prefix checks become one automaton walk
+        # regardless of how large the configured command lists grow; otherwise
+        # the tuple-startswith path is used
+        self._blacklist_automaton = (
+            self._build_prefix_automaton(self._BLACKLIST_PREFIXES)
+            if AHOCORASICK_AVAILABLE
+            else None
+        )
+        self._allowed_automaton = (
+            self._build_prefix_automaton(self._allowed_prefixes) if AHOCORASICK_AVAILABLE else None
+        )
+
+        # Memoize successful validations per instance: identical commands are
+        # common in MCP workloads and the policy is fixed for this validator's
+        # lifetime. Failures raise and are never cached, so rejected commands
+        # are always re-validated.
+        self._validate_cached = functools.lru_cache(maxsize=1024)(self._validate_command_impl)
+
+        # Counter driving the 1-in-256 success-log sampler
+        self._log_counter = 0
+
+        # Partial-evaluate the fixed policy: bind the policy-dependent steps
+        # once here so the hot validation path carries no policy branches
+        if policy is SecurityPolicy.STRICT:
+            self._check_dangerous_chars = self._validate_dangerous_characters
+        else:
+            self._check_dangerous_chars = self._skip_check
+        if policy is SecurityPolicy.PERMISSIVE:
+            self._check_whitelist = self._skip_check
+        else:
+            self._check_whitelist = self._enforce_whitelist
 
         self.logger.info(f"VM command security validator initialized with {policy.value} policy")
 
@@ -247,6 +384,50 @@ class VMCommandSecurityValidator:
 
         return allowed
 
+    @staticmethod
+    def _build_prefix_automaton(prefixes: Tuple[str, ...]) -> "ahocorasick.Automaton":
+        """Build an Aho-Corasick automaton over a tuple of command prefixes.
+
+        Args:
+            prefixes: Lowercase multi-token command prefixes
+
+        Returns:
+            Compiled automaton ready for matching
+        """
+        automaton = ahocorasick.Automaton()
+        for prefix in prefixes:
+            automaton.add_word(prefix, prefix)
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _match_prefix(
+        text: str, prefixes: Tuple[str, ...], automaton: Optional["ahocorasick.Automaton"]
+    ) -> Optional[str]:
+        """Find a prefix that anchors at the start of ``text``, if any.
+
+        Uses one DFA walk when the automaton is available, falling back to
+        str.startswith with the native tuple form.
+
+        Args:
+            text: Lowercase command text to check
+            prefixes: Prefix tuple used for the fallback path
+            automaton: Prebuilt automaton, or None when unavailable
+
+        Returns:
+            The matching prefix, or None when no prefix matches at position 0
+        """
+        if automaton is not None:
+            end_index: int
+            prefix: str
+            for end_index, prefix in automaton.iter(text):
+                if end_index + 1 == len(prefix):  # Match anchored at position 0
+                    return prefix
+            return None
+        if text.startswith(prefixes):
+            return next(p for p in prefixes if text.startswith(p))
+        return None
+
     def validate_command(self, command: str) -> str:
         """Validate and sanitize a command for secure execution.
 
@@ -257,6 +438,23 @@ class VMCommandSecurityValidator:
         - Length and complexity limits
         - Argument sanitization
 
+        Args:
+            command: Raw command string to validate
+
+        Returns:
+            Sanitized command string safe for execution
+
+        Raises:
+            CommandSecurityError: If command fails security validation
+        """
+        return self._validate_cached(command)
+
+    def _validate_command_impl(self, command: str) -> str:
+        """Run the full validation pipeline for a command.
+
+        Wrapped in a per-instance LRU cache by ``__init__``; see
+        ``validate_command`` for the validation steps performed.
+
         Args:
             command: Raw command string to validate
 
@@ -273,14 +471,33 @@ class VMCommandSecurityValidator:
 
         command = command.strip()
 
+        # Reject non-ASCII input outright: legitimate shell commands are
+        # ASCII, and an ASCII-only string keeps CPython on its compact
+        # one-byte representation so the regex, lower(), and translate
+        # passes below all take their ASCII fast paths
+        if not command.isascii():
+            raise CommandSecurityError(
+                "Command contains non-ASCII characters", command, "dangerous_characters"
+            )
+
         # Check command length
         self._validate_command_length(command)
 
+        # Fail fast on blacklisted command words before the regex scan: a
+        # partition plus frozenset lookup rejects the common offenders in
+        # microseconds. Obfuscated forms (quoting, injection syntax) fall
+        # through to the full pipeline below.
+        head = command.partition(" ")[0].lower()
+        if head in self._BLACKLIST_SINGLE:
+            raise CommandSecurityError(
+                f"Command '{head}' is globally blacklisted", command, "blacklisted_command"
+            )
+
         # Check for injection patterns
         self._validate_injection_patterns(command)
 
-        # Check for dangerous characters
-        self._validate_dangerous_characters(command)
+        # Check for dangerous characters (STRICT policy only; no-op otherwise)
+        self._check_dangerous_chars(command)
 
         # Parse and validate command structure
         command_parts = self._parse_command_safely(command)
@@ -291,8 +508,11 @@ class VMCommandSecurityValidator:
         # Sanitize arguments
         sanitized_command = self._sanitize_command_parts(command_parts)
 
-        # Log successful validation
-        self.logger.info(f"Command validated successfully: {sanitized_command[:50]}...")
+        # Sample successful validations (1 in 256) with deferred %-formatting;
+        # security violations are still logged unconditionally by the callers
+        if (self._log_counter & 0xFF) == 0 and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Command validated successfully: %.50s...", sanitized_command)
+        self._log_counter += 1
 
         return sanitized_command
 
@@ -305,7 +525,7 @@ class VMCommandSecurityValidator:
         Raises:
             CommandSecurityError: If command exceeds length limits
         """
-        max_length = 1000  # Reasonable maximum for most legitimate commands
+        max_length = self.MAX_COMMAND_LENGTH
 
         if len(command) > max_length:
             raise CommandSecurityError(
@@ -323,26 +543,45 @@ class VMCommandSecurityValidator:
         Raises:
             CommandSecurityError: If injection patterns are detected
         """
-        for pattern_regex in self._injection_regex:
-            if pattern_regex.search(command):
-                raise CommandSecurityError(
-                    f"Command contains potential injection pattern: {pattern_regex.pattern}",
-                    command,
-                    "injection_pattern",
-                )
+        # Fast path: if no injection-trigger character survives the deletion
+        # table, none of the patterns can match and the regex scan is skipped
+        if len(command.translate(self._injection_trigger_table)) == len(command):
+            return
+
+        match = self._injection_regex.search(command)
+        if match:
+            # Map the winning named group back to its source pattern; the
+            # groupdict walk only runs on the (rare) rejection path. The
+            # empty-string sentinel keeps the lookup str-keyed when no
+            # group claimed the match.
+            group_name: str = next(
+                (name for name, value in match.groupdict().items() if value is not None),
+                "",
+            )
+            pattern = self._injection_pattern_by_group.get(group_name, "<unknown>")
+            raise CommandSecurityError(
+                f"Command contains potential injection pattern: "
+                f"{match.group(0)!r} (matched {pattern!r})",
+                command,
+                "injection_pattern",
+            )
 
     def _validate_dangerous_characters(self, command: str) -> None:
         """Check for dangerous characters that could enable injection.
 
+        Only bound as the active check under the STRICT policy; other
+        policies bind ``_skip_check`` in its place.
+
         Args:
             command: Command to validate
 
         Raises:
             CommandSecurityError: If dangerous characters are found
         """
-        found_chars = set(command) & self.DANGEROUS_CHARS
-
-        if found_chars and self.policy == SecurityPolicy.STRICT:
+        if len(command.translate(self._danger_table)) != len(command):
+            # Materialize the offending characters only on the failure path,
+            # using the indexed lookup table instead of set hashing
+            found_chars = {ch for ch in command if self._DANGER_LOOKUP[ord(ch)]}
             raise CommandSecurityError(
                 f"Command contains dangerous characters: {', '.join(found_chars)}",
                 command,
@@ -361,6 +600,11 @@ class VMCommandSecurityValidator:
         Raises:
             CommandSecurityError: If command cannot be parsed safely
         """
+        # Fast path: with no quoting or escaping characters present,
+        # whitespace splitting is equivalent to shlex and far cheaper
+        if len(command.translate(self._QUOTE_TABLE)) == len(command):
+            return command.split()
+
         try:
             # Use shlex for safe parsing that handles quotes and escaping
             return shlex.split(command)
@@ -381,29 +625,55 @@ class VMCommandSecurityValidator:
         if not command_parts:
             raise CommandSecurityError("No command specified", "", "no_command")
 
+        # Lowercase each token exactly once; the command word is reused for
+        # the two-token prefix form instead of re-lowering the joined string
         base_command = command_parts[0].lower()
-        full_command = " ".join(command_parts[:2]).lower()  # Command + first arg
-
-        # Check global blacklist first
-        for blocked in self.GLOBAL_BLACKLIST:
-            if base_command == blocked.lower() or full_command.startswith(blocked.lower()):
-                raise CommandSecurityError(
-                    f"Command '{blocked}' is globally blacklisted",
-                    " ".join(command_parts),
-                    "blacklisted_command",
-                )
-
-        # In PERMISSIVE mode, only check blacklist
-        if self.policy == SecurityPolicy.PERMISSIVE:
-            return
+        if len(command_parts) > 1:
+            full_command = f"{base_command} {command_parts[1].lower()}"  # Command + first arg
+        else:
+            full_command = base_command
+
+        # Check global blacklist first: hash lookup for single commands, one
+        # anchored prefix match for multi-token entries
+        blocked: Optional[str] = None
+        if base_command in self._BLACKLIST_SINGLE:
+            blocked = base_command
+        else:
+            blocked = self._match_prefix(
+                full_command, self._BLACKLIST_PREFIXES, self._blacklist_automaton
+            )
+        if blocked is not None:
+            raise CommandSecurityError(
+                f"Command '{blocked}' is globally blacklisted",
+                " ".join(command_parts),
+                "blacklisted_command",
+            )
+
+        # Whitelist enforcement is policy-bound at init: PERMISSIVE binds
+        # _skip_check here and stops after the blacklist pass
+        self._check_whitelist(command_parts, base_command, full_command)
 
-        # Check whitelist for STRICT and STANDARD modes
-        command_authorized = False
+    def _enforce_whitelist(
+        self, command_parts: List[str], base_command: str, full_command: str
+    ) -> None:
+        """Require the command to appear in the allowed list.
 
-        for allowed in self._allowed_commands:
-            if base_command == allowed.lower() or full_command.startswith(allowed.lower()):
-                command_authorized = True
-                break
+        Bound as the active whitelist check for STRICT and STANDARD
+        policies; PERMISSIVE binds ``_skip_check`` instead.
+
+        Args:
+            command_parts: Parsed command parts
+            base_command: Lowercased command word
+            full_command: Lowercased command word plus first argument
+
+        Raises:
+            CommandSecurityError: If command is not authorized
+        """
+        command_authorized = (
+            base_command in self._allowed_single
+            or self._match_prefix(full_command, self._allowed_prefixes, self._allowed_automaton)
+            is not None
+        )
 
         if not command_authorized:
             raise CommandSecurityError(
@@ -412,6 +682,10 @@ class VMCommandSecurityValidator:
                 "unauthorized_command",
             )
 
+    @staticmethod
+    def _skip_check(*_args: object) -> None:
+        """No-op stand-in for policy checks disabled at init time."""
+
     def _sanitize_command_parts(self, command_parts: List[str]) -> str:
         """Sanitize command parts and reassemble safely.
 
@@ -441,9 +715,13 @@ class VMCommandSecurityValidator:
         }
 
 
+@functools.cache
 def create_security_validator(policy_name: str = "standard") -> VMCommandSecurityValidator:
     """Factory function to create a security validator with specified policy.
 
+    Validators are immutable once built, so one instance per policy name is
+    cached and shared rather than recompiling the regex and lookup tables.
+
     Args:
         policy_name: Security policy name ("strict", "standard", or "permissive")
 
@@ -13,7 +13,8 @@ The tools implement fallback mechanisms for scenarios where
 detailed container information might be temporarily unavailable.
 """
 
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from mcp.types import TextContent as Content
 
@@ -33,6 +34,19 @@ class ContainerTools(ProxmoxTool):
     container information might be temporarily unavailable.
     """
 
+    # Container config (cores, ostemplate) is near-static, so cached entries
+    # are served for this long before the API is queried again
+    _CONFIG_CACHE_TTL = 60.0
+
+    def __init__(self, proxmox_api: Any) -> None:
+        """Initialize container tools.
+
+        Args:
+            proxmox_api: Initialized ProxmoxAPI instance
+        """
+        super().__init__(proxmox_api)
+        self._config_cache: Dict[Tuple[str, int], Tuple[float, Dict[str, Any]]] = {}
+
     def get_containers(self) -> List[Content]:
         """List all LXC containers across the cluster with detailed status.
 
@@ -67,10 +81,16 @@ class ContainerTools(ProxmoxTool):
             RuntimeError: If the cluster-wide container query fails
         """
         try:
-            all_containers = []
-            for node_name in self._get_all_nodes():
-                containers = self._get_containers_for_node(node_name)
-                all_containers.extend(containers)
+            node_names = self._get_all_nodes()
+            # Overlap the per-node and per-container HTTP round trips so wall
+            # time is bounded by the slowest request, not the request count
+            node_lists = list(self._IO_EXECUTOR.map(self._get_node_containers, node_names))
+            pairs = [
+                (node_name, container)
+                for node_name, containers in zip(node_names, node_lists, strict=True)
+                for container in containers
+            ]
+            all_containers = list(self._IO_EXECUTOR.map(self._get_container_details_pair, pairs))
             return self._format_response(all_containers, "containers")
         except Exception as e:
             self._handle_error("get containers", e, resource_type="container")
@@ -78,7 +98,7 @@ class ContainerTools(ProxmoxTool):
 
     def _get_all_nodes(self) -> List[str]:
         """Fetch all node names in the Proxmox cluster."""
-        return [node["node"] for node in self.proxmox.nodes.get()]
+        return [node["node"] for node in self._cached_list("nodes", self.proxmox.nodes.get)]
 
     def _get_containers_for_node(self, node_name: str) -> List[Dict[str, Any]]:
         """Retrieve and format all containers on a given node."""
@@ -89,17 +109,43 @@ class ContainerTools(ProxmoxTool):
         """Fetch list of LXC containers from a specific node."""
         return self.proxmox.nodes(node_name).lxc.get()
 
+    def _get_cached_config(self, node_name: str, vmid: int) -> Optional[Dict[str, Any]]:
+        """Fetch container config with a short-TTL cache, or None on failure.
+
+        Avoids re-issuing one REST call per container on every listing when
+        the underlying values rarely change. Failed lookups are not cached so
+        transient API errors don't stick for the TTL window.
+        """
+        cache_key = (node_name, vmid)
+        cached = self._config_cache.get(cache_key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._CONFIG_CACHE_TTL:
+            return cached[1]
+
+        try:
+            config: Dict[str, Any] = self.proxmox.nodes(node_name).lxc(vmid).config.get()
+        except Exception:
+            return None
+
+        self._config_cache[cache_key] = (now, config)
+        return config
+
+    def _get_container_details_pair(self, pair: Tuple[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Unpack a (node, container) pair for executor.map fan-out."""
+        node_name, container = pair
+        return self._get_container_details(node_name, container)
+
     def _get_container_details(self, node_name: str, container: Dict[str, Any]) -> Dict[str, Any]:
         """Retrieve detailed info about a container or fallback to minimal info.
 
         Tries to fetch config info for CPU and template; falls back if failed.
         """
         vmid = container["vmid"]
-        try:
-            config = self.proxmox.nodes(node_name).lxc(vmid).config.get()
+        config = self._get_cached_config(node_name, vmid)
+        if config is not None:
             cpus = config.get("cores", "N/A")
             template = config.get("ostemplate", "N/A")
-        except Exception:
+        else:
             cpus = "N/A"
             template = "N/A"
 
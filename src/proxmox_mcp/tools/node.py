@@ -62,8 +62,9 @@ class NodeTools(ProxmoxTool):
             RuntimeError: If the cluster-wide node query fails
         """
         try:
-            node_list = self.proxmox.nodes.get()
-            detailed_nodes = [self._get_node_details(node) for node in node_list]
+            node_list = self._cached_list("nodes", self.proxmox.nodes.get)
+            # Fetch per-node status concurrently; each is an HTTP round trip
+            detailed_nodes = list(self._IO_EXECUTOR.map(self._get_node_details, node_list))
             return self._format_response(detailed_nodes, "nodes")
         except Exception as e:
             self._handle_error("get nodes", e, resource_type="node")
@@ -82,20 +83,26 @@ class NodeTools(ProxmoxTool):
         self, node: Dict[str, Any], status: Dict[str, Any] | None
     ) -> Dict[str, Any]:
         """Format node status for output, with fallback support."""
+        if status:
+            memory = status.get("memory", {})
+            uptime = status.get("uptime", 0)
+            maxcpu = status.get("cpuinfo", {}).get("cpus", "N/A")
+            memory_used = memory.get("used", 0)
+            memory_total = memory.get("total", 0)
+        else:
+            uptime = 0
+            maxcpu = "N/A"
+            memory_used = node.get("maxmem", 0) - node.get("mem", 0)
+            memory_total = node.get("maxmem", 0)
+
         return {
             "node": node["node"],
             "status": node["status"],
-            "uptime": status.get("uptime", 0) if status else 0,
-            "maxcpu": status.get("cpuinfo", {}).get("cpus", "N/A") if status else "N/A",
+            "uptime": uptime,
+            "maxcpu": maxcpu,
             "memory": {
-                "used": (
-                    status.get("memory", {}).get("used", 0)
-                    if status
-                    else node.get("maxmem", 0) - node.get("mem", 0)
-                ),
-                "total": (
-                    status.get("memory", {}).get("total", 0) if status else node.get("maxmem", 0)
-                ),
+                "used": memory_used,
+                "total": memory_total,
             },
         }
 
@@ -64,8 +64,9 @@ class StorageTools(ProxmoxTool):
             RuntimeError: If the cluster-wide storage query fails
         """
         try:
-            all_storage = self.proxmox.storage.get()
-            detailed_storage = [self._get_storage_details(store) for store in all_storage]
+            all_storage = self._cached_list("storage", self.proxmox.storage.get)
+            # Fetch per-pool status concurrently; each is an HTTP round trip
+            detailed_storage = list(self._IO_EXECUTOR.map(self._get_storage_details, all_storage))
             return self._format_response(detailed_storage, "storage")
         except Exception as e:
             self._handle_error("get storage", e, resource_type="storage")
@@ -86,12 +87,18 @@ class StorageTools(ProxmoxTool):
         self, store: Dict[str, Any], status: Dict[str, Any] | None
     ) -> Dict[str, Any]:
         """Format storage data for response output."""
+        if status:
+            get = status.get
+            used, total, available = get("used", 0), get("total", 0), get("avail", 0)
+        else:
+            used = total = available = 0
+
         return {
             "storage": store["storage"],
             "type": store["type"],
             "content": store.get("content", []),
             "status": "online" if store.get("enabled", True) else "offline",
-            "used": status.get("used", 0) if status else 0,
-            "total": status.get("total", 0) if status else 0,
-            "available": status.get("avail", 0) if status else 0,
+            "used": used,
+            "total": total,
+            "available": available,
         }
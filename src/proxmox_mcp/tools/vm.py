@@ -14,10 +14,13 @@ The tools implement fallback mechanisms for scenarios where
 detailed VM information might be temporarily unavailable.
 """
 
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Dict, List, Tuple
 
 from mcp.types import TextContent as Content
 
+from ..formatting import ProxmoxFormatters
 from .base import ProxmoxTool
 from .console.manager import VMConsoleManager
 
@@ -80,18 +83,62 @@ class VMTools(ProxmoxTool):
             RuntimeError: If the cluster-wide VM query fails
         """
         try:
-            result = []
-            for node_name in self._get_all_nodes():
-                vms = self._get_vms_for_node(node_name)
-                result.extend(vms)
+            # Primary path: one cluster-wide query instead of one round trip
+            # per node plus one per VM
+            result = self._get_cluster_vms()
+            if not result:
+                result = self._get_vms_per_node()
             return self._format_response(result, "vms")
         except Exception as e:
             self._handle_error("get VMs", e, resource_type="vm")
             return []
 
+    def _get_cluster_vms(self) -> List[Dict[str, Any]]:
+        """Fetch all VMs via the aggregated cluster resources endpoint.
+
+        /cluster/resources?type=vm returns vmid, name, status, node and
+        resource usage for every guest in a single API call. The endpoint
+        includes LXC containers despite the type=vm filter, so entries are
+        narrowed to qemu guests here. Returns an empty list when the
+        endpoint is unavailable so callers can fall back to the per-node
+        listing path.
+        """
+        try:
+            resources = self.proxmox.cluster.resources.get(type="vm")
+            return [
+                self._format_cluster_vm(resource)
+                for resource in resources
+                if resource.get("type") == "qemu"
+            ]
+        except Exception as e:
+            self.logger.warning(f"Cluster resources query failed, using per-node listing: {e}")
+            return []
+
+    def _get_vms_per_node(self) -> List[Dict[str, Any]]:
+        """Fetch VMs node by node, used when cluster resources are unavailable."""
+        node_names = self._get_all_nodes()
+        # Query all nodes concurrently; each per-node listing is an
+        # independent HTTP round trip. Chain the per-node results straight
+        # into one flat list rather than materializing a list of lists first.
+        return list(chain.from_iterable(self._IO_EXECUTOR.map(self._get_vms_for_node, node_names)))
+
+    def _format_cluster_vm(self, resource: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a cluster resources entry into the standard VM shape."""
+        return {
+            "vmid": resource["vmid"],
+            "name": resource.get("name", "N/A"),
+            "status": resource.get("status", "unknown"),
+            "node": resource.get("node", "N/A"),
+            "cpus": resource.get("maxcpu", "N/A"),
+            "memory": {
+                "used": resource.get("mem", 0),
+                "total": resource.get("maxmem", 0),
+            },
+        }
+
     def _get_all_nodes(self) -> List[str]:
         """Retrieve a list of all node names in the cluster."""
-        return [node["node"] for node in self.proxmox.nodes.get()]
+        return [node["node"] for node in self._cached_list("nodes", self.proxmox.nodes.get)]
 
     def _get_vms_for_node(self, node_name: str) -> List[Dict[str, Any]]:
         """Fetch VM details for a specific node, with config fallback and error isolation."""
@@ -104,15 +151,27 @@ class VMTools(ProxmoxTool):
             return []
 
     def _get_vm_configs(self, node_name: str, vmids: List[int]) -> Dict[int, Any]:
-        """Batch fetch VM config data with fallback."""
-        configs = {}
-        for vmid in vmids:
+        """Batch fetch VM config data with fallback.
+
+        Dispatches the per-VM config requests concurrently so wall time is
+        bounded by the slowest round trip rather than the VM count. Failed
+        lookups map to None, preserving the fallback semantics.
+        """
+        if not vmids:
+            return {}
+
+        def fetch(vmid: int) -> Tuple[int, Any]:
             try:
-                config = self.proxmox.nodes(node_name).qemu(vmid).config.get()
-                configs[vmid] = config
+                return vmid, self.proxmox.nodes(node_name).qemu(vmid).config.get()
             except Exception:
-                configs[vmid] = None
-        return configs
+                return vmid, None
+
+        # Runs inside tasks already scheduled on the shared _IO_EXECUTOR, so
+        # use a dedicated short-lived pool here: submitting nested work to the
+        # same bounded pool could starve it once every worker is waiting on
+        # its own children
+        with ThreadPoolExecutor(max_workers=min(16, len(vmids))) as executor:
+            return dict(executor.map(fetch, vmids))
 
     def _format_vm(
         self, vm: Dict[str, Any], config: Dict[str, Any] | None, node_name: str
@@ -158,9 +217,6 @@ class VMTools(ProxmoxTool):
         """
         try:
             result = await self.console_manager.execute_command(node, vmid, command)
-            # Use the command output formatter from ProxmoxFormatters
-            from ..formatting import ProxmoxFormatters
-
             formatted = ProxmoxFormatters.format_command_output(
                 success=result["success"],
                 command=command,
@@ -21,14 +21,17 @@ Examples:
 """
 
 import argparse
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import json
 import os
 from pathlib import Path
 import platform
+import re
 import shutil
 import sys
-from typing import List, Optional
+import time
+from typing import List, Optional, TypeGuard, cast
 
 # Add the src directory to the path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -36,6 +39,120 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from proxmox_mcp.config.loader import encrypt_config_file
 from proxmox_mcp.utils.encryption import TokenEncryption
 
+try:
+    import orjson  # type: ignore[import]
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    # ijson streams JSON tokens and can stop at the first hit, so probing
+    # a large config parses only the bytes up to auth.token_value
+    import ijson  # type: ignore[import]
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+def _parse_json_bytes(raw: bytes) -> dict:
+    """Parse JSON from raw bytes, using orjson's C parser when available.
+
+    Config files hold a JSON object at top level, so the untyped parser
+    results are cast to dict for the callers.
+    """
+    if ORJSON_AVAILABLE:
+        return cast(dict, orjson.loads(raw))
+    return cast(dict, json.loads(raw))
+
+
+def _load_json(config_path: str) -> dict:
+    """Read and parse a JSON config file in one pass."""
+    with open(config_path, "rb") as f:
+        return _parse_json_bytes(f.read())
+
+
+def _dump_json(config_path: str, config_data: dict) -> None:
+    """Write a JSON config file with 2-space indent, via orjson when available.
+
+    Serializes to a single buffer written to a sibling temp file and swaps
+    it into place with os.replace, so the write is one syscall instead of
+    json.dump's many small chunks and a crash mid-write can never leave a
+    truncated config behind.
+    """
+    if ORJSON_AVAILABLE:
+        buf = orjson.dumps(config_data, option=orjson.OPT_INDENT_2)
+    else:
+        buf = json.dumps(config_data, indent=2).encode()
+
+    tmp_path = f"{config_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(buf)
+    os.replace(tmp_path, config_path)
+
+
+# Matches the auth.token_value scalar (including escapes) directly in the
+# raw bytes, so status checks and bulk scans avoid building the full dict
+# tree. Anchoring to the "auth" object keeps this probe in agreement with
+# the ijson path, which only reports auth.token_value; [^{}]*? relies on
+# auth being a flat object of strings, which the config schema guarantees.
+_TOKEN_VALUE_RE = re.compile(rb'"auth"\s*:\s*\{[^{}]*?"token_value"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Prefix marking a value as an encrypted token
+_ENC_PREFIX = "enc:"
+
+
+def _is_encrypted_token(value: object) -> TypeGuard[str]:
+    """Return True when a config value is an enc:-prefixed encrypted token.
+
+    Uses an exact type check and a slice compare, which beats the
+    isinstance-plus-startswith idiom in the bulk-rotation loop; str
+    subclasses are not expected in parsed JSON. The TypeGuard lets mypy
+    narrow probed Optional[str] values to str at the call sites.
+    """
+    return type(value) is str and value[:4] == _ENC_PREFIX
+
+
+def _probe_token_value(config_path: str) -> Optional[str]:
+    """Extract auth.token_value from a config file without a full JSON parse.
+
+    Reads the file as bytes and matches the token_value scalar with a
+    precompiled regex, decoding only that one JSON string. Config files are
+    small, but bulk operations probe many of them just to learn whether the
+    token is encrypted, so skipping the full parse keeps that scan cheap.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        The token value string, or None if the field is not present
+    """
+    if IJSON_AVAILABLE:
+        # Incremental parse: stops at the field instead of reading and
+        # scanning the remainder of the file
+        with open(config_path, "rb") as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == "auth.token_value" and event == "string":
+                    return cast(str, value)
+        return None
+
+    with open(config_path, "rb") as f:
+        return _probe_token_value_bytes(f.read())
+
+
+def _probe_token_value_bytes(raw: bytes) -> Optional[str]:
+    """Extract auth.token_value from raw config bytes without a full parse.
+
+    Callers that already hold the file contents probe the same buffer they
+    later parse, so each file is read from disk exactly once.
+    """
+    match = _TOKEN_VALUE_RE.search(raw)
+    if match is None:
+        return None
+    # Decode just the matched scalar so JSON escapes are handled correctly
+    return cast(str, json.loads(b'"' + match.group(1) + b'"'))
+
 
 def clear_terminal_if_requested() -> None:
     """Offer to clear terminal for security after key operations."""
@@ -133,21 +250,18 @@ def show_encryption_status(config_path: str) -> None:
             print(f"❌ Error: Configuration file not found: {config_path}")
             sys.exit(1)
 
-        with open(config_path) as f:
-            config_data = json.load(f)
+        token_value = _probe_token_value(config_path)
 
         print(f"📄 Configuration file: {config_path}")
         print()
 
         # Check token encryption status
-        if "auth" in config_data and "token_value" in config_data["auth"]:
-            token_value = config_data["auth"]["token_value"]
-            if isinstance(token_value, str) and token_value.startswith("enc:"):
-                print("🔒 Token value: ENCRYPTED ✅")
-            else:
-                print("🔓 Token value: PLAIN TEXT ⚠️")
-        else:
+        if token_value is None:
             print("❓ Token value: NOT FOUND")
+        elif _is_encrypted_token(token_value):
+            print("🔒 Token value: ENCRYPTED ✅")
+        else:
+            print("🔓 Token value: PLAIN TEXT ⚠️")
 
         print()
 
@@ -176,7 +290,9 @@ def create_backup(file_path: str) -> str:
     Raises:
         OSError: If backup creation fails
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # time.strftime skips the datetime object construction that
+    # datetime.now().strftime would pay per backup
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     backup_path = f"{file_path}.backup.{timestamp}"
 
     try:
@@ -186,6 +302,35 @@ def create_backup(file_path: str) -> str:
         raise OSError(f"Failed to create backup: {e}") from e
 
 
+def create_backup_by_rename(file_path: str) -> str:
+    """Move a file to a timestamped backup path instead of copying it.
+
+    Rotation rewrites the config from the already-parsed data, so the
+    backup only needs to preserve the previous bytes: a rename is a
+    constant-time metadata operation (the backup is a sibling path, so it
+    stays on the same filesystem), while a copy rereads and rewrites the
+    whole file. The original path does not exist until the caller writes
+    the rotated config, so callers must restore the backup on failure.
+
+    Args:
+        file_path: Path to the file to move aside
+
+    Returns:
+        Path to the backup file
+
+    Raises:
+        OSError: If backup creation fails
+    """
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    backup_path = f"{file_path}.backup.{timestamp}"
+
+    try:
+        os.rename(file_path, backup_path)
+        return backup_path
+    except Exception as e:
+        raise OSError(f"Failed to create backup: {e}") from e
+
+
 def verify_config_decryption(config_path: str, old_key: str) -> bool:
     """Verify that a configuration file can be decrypted with the old key.
 
@@ -197,26 +342,20 @@ def verify_config_decryption(config_path: str, old_key: str) -> bool:
         True if the file can be decrypted, False otherwise
     """
     try:
-        # Create encryptor with old key
-        old_encryptor = TokenEncryption(master_key=old_key)
-
-        # Load config file
-        with open(config_path) as f:
-            config_data = json.load(f)
-
-        # Check if there are any encrypted tokens
-        if "auth" in config_data and "token_value" in config_data["auth"]:
-            token_value = config_data["auth"]["token_value"]
-            if isinstance(token_value, str) and token_value.startswith("enc:"):
-                # Try to decrypt the token
-                try:
-                    old_encryptor.decrypt_token(token_value)
-                    return True
-                except Exception:
-                    return False
-
-        # If no encrypted tokens found, assume verification passed
-        return True
+        # Probe before touching the key: if no encrypted token is present
+        # the (deliberately slow) PBKDF2 in TokenEncryption construction
+        # can be skipped entirely
+        token_value = _probe_token_value(config_path)
+        if not _is_encrypted_token(token_value):
+            # If no encrypted tokens found, assume verification passed
+            return True
+
+        # Try to decrypt the token with the old key
+        try:
+            TokenEncryption(master_key=old_key).decrypt_token(token_value)
+            return True
+        except Exception:
+            return False
 
     except Exception:
         return False
@@ -286,44 +425,63 @@ def _handle_new_key_generation(new_key: Optional[str]) -> str:
     return new_key
 
 
-def _perform_token_rotation(config_path: str, old_key: str, new_key: str) -> List[str]:
-    """Perform the actual token rotation in a configuration file.
+def _rotate_from_parsed(
+    config_path: str,
+    config_data: dict,
+    old_encryptor: TokenEncryption,
+    new_encryptor: TokenEncryption,
+) -> List[str]:
+    """Rotate encrypted tokens in an already-parsed configuration.
+
+    Takes the parsed dict and preconstructed encryptors so callers that
+    have already inspected the file (e.g. bulk rotation) don't re-read and
+    re-parse it for the rotation itself.
 
     Args:
-        config_path: Path to the configuration file
-        old_key: Current master key for decryption
-        new_key: New master key for encryption
+        config_path: Path the rotated configuration is written back to
+        config_data: Parsed configuration dictionary (mutated in place)
+        old_encryptor: Encryptor holding the current master key
+        new_encryptor: Encryptor holding the new master key
 
     Returns:
         List of rotated field names
     """
-    # Create encryptors
-    old_encryptor = TokenEncryption(master_key=old_key)
-    new_encryptor = TokenEncryption(master_key=new_key)
-
-    # Load configuration
-    with open(config_path) as f:
-        config_data = json.load(f)
-
-    # Track what was rotated
     rotated_fields: List[str] = []
 
     # Rotate token_value if encrypted
     if "auth" in config_data and "token_value" in config_data["auth"]:
         token_value = config_data["auth"]["token_value"]
-        if isinstance(token_value, str) and token_value.startswith("enc:"):
+        if _is_encrypted_token(token_value):
             # Decrypt with old key and re-encrypt with new key
             decrypted_token = old_encryptor.decrypt_token(token_value)
             config_data["auth"]["token_value"] = new_encryptor.encrypt_token(decrypted_token)
             rotated_fields.append("auth.token_value")
 
     # Save rotated configuration
-    with open(config_path, "w") as f:
-        json.dump(config_data, f, indent=2)
+    _dump_json(config_path, config_data)
 
     return rotated_fields
 
 
+def _perform_token_rotation(config_path: str, old_key: str, new_key: str) -> List[str]:
+    """Perform the actual token rotation in a configuration file.
+
+    Args:
+        config_path: Path to the configuration file
+        old_key: Current master key for decryption
+        new_key: New master key for encryption
+
+    Returns:
+        List of rotated field names
+    """
+    old_encryptor = TokenEncryption(master_key=old_key)
+    new_encryptor = TokenEncryption(master_key=new_key)
+
+    config_data = _load_json(config_path)
+
+    return _rotate_from_parsed(config_path, config_data, old_encryptor, new_encryptor)
+
+
 def _display_rotation_summary(
     config_path: str, backup_path: str, rotated_fields: List[str]
 ) -> None:
@@ -365,13 +523,29 @@ def rotate_master_key(config_path: str, new_key: Optional[str] = None) -> None:
 
         old_key = _validate_rotation_environment(config_path)
 
-        print("💾 Creating backup...")
-        backup_path = create_backup(config_path)
-        print(f"✅ Backup created: {backup_path}")
-
+        # Generate and validate the new key before touching the file: the
+        # rename below leaves no config at config_path until the rotated
+        # copy is written, so that window must stay as small as possible
         new_key = _handle_new_key_generation(new_key)
 
-        rotated_fields = _perform_token_rotation(config_path, old_key, new_key)
+        # Parse before the backup so the rotated config can be rebuilt from
+        # memory once the original bytes have been moved aside
+        config_data = _load_json(config_path)
+
+        print("💾 Creating backup...")
+        backup_path = create_backup_by_rename(config_path)
+        try:
+            print(f"✅ Backup created: {backup_path}")
+            rotated_fields = _rotate_from_parsed(
+                config_path,
+                config_data,
+                TokenEncryption(master_key=old_key),
+                TokenEncryption(master_key=new_key),
+            )
+        except Exception:
+            # The rename left no file at config_path; put the snapshot back
+            os.replace(backup_path, config_path)
+            raise
 
         _display_rotation_summary(config_path, backup_path, rotated_fields)
 
@@ -406,11 +580,20 @@ def _find_config_files(directory: str) -> List[str]:
         print(f"❌ Error: Path is not a directory: {directory}")
         sys.exit(1)
 
-    # Find all JSON files in directory
+    # Find all JSON files with an iterative os.scandir walk: DirEntry
+    # carries cached type information and plain-string filtering avoids the
+    # Path allocation and fnmatch work rglob does per entry
     config_files: List[str] = []
-    for file_path in Path(directory).rglob("*.json"):
-        if not file_path.name.startswith("config.example"):  # Skip example files
-            config_files.append(str(file_path))
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json") and not entry.name.startswith(
+                    "config.example"
+                ):  # Skip example files
+                    config_files.append(entry.path)
 
     if not config_files:
         print(f"❌ No configuration files found in: {directory}")
@@ -447,41 +630,58 @@ def _prepare_bulk_rotation(new_key: Optional[str]) -> str:
     return new_key
 
 
-def _process_single_config(config_file: str, new_key: str) -> bool:
+def _process_single_config(
+    config_file: str, old_encryptor: TokenEncryption, new_encryptor: TokenEncryption
+) -> tuple[bool, str]:
     """Process a single configuration file for bulk rotation.
 
+    Status lines are buffered and returned rather than printed: workers run
+    concurrently, so the caller writes each file's block in one piece to
+    keep the output ordered and avoid per-line write syscalls.
+
     Args:
         config_file: Path to the configuration file
-        new_key: New master key to use
+        old_encryptor: Shared encryptor holding the current master key
+        new_encryptor: Shared encryptor holding the new master key
 
     Returns:
-        True if rotation was successful, False otherwise
+        Tuple of (success, buffered status output for this file)
     """
+    messages = [f"📝 Processing: {os.path.basename(config_file)}\n"]
     try:
-        print(f"📝 Processing: {os.path.basename(config_file)}")
-
-        # Check if file has encrypted content
-        with open(config_file) as f:
-            config_data = json.load(f)
-
-        has_encrypted_content = False
-        if "auth" in config_data and "token_value" in config_data["auth"]:
-            token_value = config_data["auth"]["token_value"]
-            if isinstance(token_value, str) and token_value.startswith("enc:"):
-                has_encrypted_content = True
-
-        if not has_encrypted_content:
-            print("   ⏭️  Skipping (no encrypted content)")
-            return True  # Not an error, just nothing to do
-
-        # Perform rotation
-        rotate_master_key(config_file, new_key)
-        print("   ✅ Rotated successfully")
-        return True
+        # Read once; the encryption probe and the full parse below share
+        # the same byte buffer
+        with open(config_file, "rb") as f:
+            raw = f.read()
+
+        if not _is_encrypted_token(_probe_token_value_bytes(raw)):
+            messages.append("   ⏭️  Skipping (no encrypted content)\n")
+            return True, "".join(messages)  # Not an error, just nothing to do
+
+        # Parse once and rotate from the parsed dict; a failed decrypt with
+        # the old key raises and is reported as a per-file failure below
+        config_data = _parse_json_bytes(raw)
+
+        # Confirm against the parsed dict before moving the file aside: the
+        # byte probe is a pre-filter, and renaming must only happen when
+        # _rotate_from_parsed will actually rotate something
+        if not _is_encrypted_token(config_data.get("auth", {}).get("token_value")):
+            messages.append("   ⏭️  Skipping (no encrypted content)\n")
+            return True, "".join(messages)
+
+        backup_path = create_backup_by_rename(config_file)
+        try:
+            _rotate_from_parsed(config_file, config_data, old_encryptor, new_encryptor)
+        except Exception:
+            # The rename left no file at config_file; put the snapshot back
+            os.replace(backup_path, config_file)
+            raise
+        messages.append("   ✅ Rotated successfully\n")
+        return True, "".join(messages)
 
     except Exception as e:
-        print(f"   ❌ Failed: {e}")
-        return False
+        messages.append(f"   ❌ Failed: {e}\n")
+        return False, "".join(messages)
 
 
 def _display_bulk_summary(
@@ -549,12 +749,38 @@ def _rotate_all_configs(
     successful_rotations: List[str] = []
     failed_rotations: List[tuple[str, str]] = []
 
-    for config_file in config_files:
-        if _process_single_config(config_file, new_key):
+    old_key = os.getenv("PROXMOX_MCP_MASTER_KEY")
+    if not old_key:
+        print("❌ Error: No master key found in environment variable PROXMOX_MCP_MASTER_KEY")
+        sys.exit(1)
+
+    # Derive both Fernet keys once: TokenEncryption construction runs a
+    # deliberately slow PBKDF2, so per-file construction would multiply
+    # that cost by the file count
+    old_encryptor = TokenEncryption(master_key=old_key)
+    new_encryptor = TokenEncryption(master_key=new_key)
+
+    # Each file is independent (blocking I/O plus Fernet work that releases
+    # the GIL inside OpenSSL), so process them concurrently; map preserves
+    # input order for the summary
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        results = list(
+            executor.map(
+                lambda config_file: _process_single_config(
+                    config_file, old_encryptor, new_encryptor
+                ),
+                config_files,
+            )
+        )
+
+    for config_file, (succeeded, output) in zip(config_files, results, strict=True):
+        # One write per file keeps each file's block contiguous and skips
+        # the per-line flush that print() would incur
+        sys.stdout.write(f"{output}\n")
+        if succeeded:
             successful_rotations.append(config_file)
         else:
             failed_rotations.append((config_file, "Processing failed"))
-        print()
 
     return successful_rotations, failed_rotations
 
@@ -564,9 +790,13 @@ def _handle_bulk_rotation_error(e: Exception) -> None:
     sys.exit(1)
 
 
+@functools.cache
 def _setup_argument_parser() -> argparse.ArgumentParser:
     """Set up and configure the command-line argument parser.
 
+    Built lazily on first use and memoized, so repeated in-process
+    invocations of main() (scripted use, tests) construct the parser once.
+
     Returns:
         Configured ArgumentParser instance
     """
@@ -232,6 +232,27 @@ class TestKeyRotation:
             finally:
                 os.unlink(f.name)
 
+    def test_verify_config_decryption_token_outside_auth(self) -> None:
+        """Test that token_value keys outside the auth object are not probed."""
+        master_key = TokenEncryption.generate_master_key()
+        encryptor = TokenEncryption(master_key=master_key)
+        encrypted_token = encryptor.encrypt_token("db-token")  # nosec: test credential
+
+        # Encrypted-looking value, but not under auth: the probe must ignore it
+        test_config = {"database": {"token_value": encrypted_token}}
+
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
+            json.dump(test_config, f)
+            f.flush()
+
+            try:
+                # A key that cannot decrypt the token still verifies, since
+                # there is no auth.token_value to check
+                random_key = TokenEncryption.generate_master_key()
+                assert verify_config_decryption(f.name, random_key)
+            finally:
+                os.unlink(f.name)
+
     def test_verify_config_decryption_no_token(self) -> None:
         """Test config decryption verification with no token."""
         test_config = {"other": "data"}
@@ -336,6 +357,44 @@ class TestKeyRotation:
             finally:
                 os.unlink(f.name)
 
+    def test_rotate_master_key_restores_backup_on_failure(self) -> None:
+        """Test that a failed rotation restores the original config file."""
+        old_key = TokenEncryption.generate_master_key()
+        old_encryptor = TokenEncryption(master_key=old_key)
+        encrypted_token = old_encryptor.encrypt_token("test-token-value")  # nosec: test credential
+
+        test_config = {"auth": {"token_value": encrypted_token}}
+
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
+            json.dump(test_config, f)
+            f.flush()
+
+            try:
+                # The backup is rename-based, so a failure after it must put
+                # the original bytes back at the config path
+                with patch.dict(os.environ, {"PROXMOX_MCP_MASTER_KEY": old_key}):
+                    with patch(
+                        "proxmox_mcp.utils.encrypt_config._rotate_from_parsed",
+                        side_effect=RuntimeError("simulated rotation failure"),
+                    ):
+                        with pytest.raises(SystemExit):
+                            rotate_master_key(f.name, TokenEncryption.generate_master_key())
+
+                # Original config must be back in place with original content
+                with open(f.name) as config_f:
+                    restored_config = json.load(config_f)
+                assert restored_config == test_config
+
+                # The restore consumes the backup, so none should remain
+                backup_files = [
+                    file
+                    for file in os.listdir(os.path.dirname(f.name))
+                    if file.startswith(os.path.basename(f.name) + ".backup.")
+                ]
+                assert backup_files == []
+            finally:
+                os.unlink(f.name)
+
     def test_rotate_master_key_all_successful(self) -> None:
         """Test successful bulk key rotation."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -5,12 +5,13 @@ Tests for the Proxmox MCP server.
 import json
 import os
 import tempfile
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from mcp.server.fastmcp.exceptions import ToolError
 import pytest
 
 from proxmox_mcp.server import ProxmoxMCPServer
+from proxmox_mcp.tools.vm import VMTools
 
 
 @pytest.fixture
@@ -201,6 +202,44 @@ async def test_get_vms(server, mock_proxmox):
     assert "vm2" in response_text, f"Expected vm2 not found in response: {response_text[:200]}"
 
 
+def test_get_vms_excludes_containers():
+    """Test that get_vms filters LXC entries out of cluster resources."""
+    # /cluster/resources?type=vm returns containers too; only qemu guests
+    # should be listed as VMs
+    mock_api = MagicMock()
+    mock_api.cluster.resources.get.return_value = [
+        {
+            "vmid": 100,
+            "name": "vm1",
+            "type": "qemu",
+            "status": "running",
+            "node": "node1",
+            "maxcpu": 2,
+            "mem": 2000000000,
+            "maxmem": 4000000000,
+        },
+        {
+            "vmid": 200,
+            "name": "container1",
+            "type": "lxc",
+            "status": "running",
+            "node": "node1",
+            "maxcpu": 1,
+            "mem": 1000000000,
+            "maxmem": 2000000000,
+        },
+    ]
+
+    response = VMTools(mock_api).get_vms()
+
+    assert len(response) == 1, f"Expected single response item, got {len(response)}"
+    response_text = response[0].text
+    assert "vm1" in response_text, f"Expected vm1 not found in response: {response_text[:200]}"
+    assert "container1" not in response_text, (
+        f"LXC entry should be excluded from VM listing: {response_text[:200]}"
+    )
+
+
 @pytest.mark.asyncio
 async def test_get_containers(server, mock_proxmox):
     """Test get_containers tool."""
@@ -0,0 +1,201 @@
+"""
+Tests for VM command security validation.
+
+This module pins the accept/reject behavior of VMCommandSecurityValidator
+across all three security policies, covering:
+- Whitelisted commands (single-token and multi-token prefixes)
+- Globally blacklisted commands and blacklisted prefixes
+- Shell injection pattern detection
+- The quoted (shlex) and unquoted (whitespace-split) parsing paths
+- Non-ASCII and over-length rejection
+- Per-instance memoization of validation results
+
+The validator has optional accelerated backends (google-re2,
+pyahocorasick); these tests assert observable behavior only, so they
+must pass identically whether or not those backends are installed.
+"""
+
+import pytest
+
+from proxmox_mcp.tools.console.security import (
+    CommandSecurityError,
+    SecurityPolicy,
+    VMCommandSecurityValidator,
+)
+
+# Accept/reject table: expected violation_type per policy, or None when the
+# command must be accepted under that policy
+ACCEPT_REJECT_TABLE = [
+    # (command, strict, standard, permissive)
+    pytest.param("uname -a", None, None, None, id="whitelisted-single"),
+    pytest.param("ls -la /home", None, None, None, id="whitelisted-with-args"),
+    pytest.param("systemctl status nginx", None, None, None, id="whitelisted-prefix"),
+    pytest.param(
+        "journalctl -u nginx",
+        "unauthorized_command",
+        None,
+        None,
+        id="standard-only-command",
+    ),
+    pytest.param(
+        "foobar --version",
+        "unauthorized_command",
+        "unauthorized_command",
+        None,
+        id="unknown-command",
+    ),
+    pytest.param(
+        "sudo ls",
+        "blacklisted_command",
+        "blacklisted_command",
+        "blacklisted_command",
+        id="blacklisted-single",
+    ),
+    pytest.param(
+        "rm -rf /tmp/scratch",
+        "blacklisted_command",
+        "blacklisted_command",
+        "blacklisted_command",
+        id="blacklisted-head-word",
+    ),
+    pytest.param(
+        "systemctl stop nginx",
+        "blacklisted_command",
+        "blacklisted_command",
+        "blacklisted_command",
+        id="blacklisted-prefix",
+    ),
+    pytest.param(
+        "ls; rm -rf /",
+        "injection_pattern",
+        "injection_pattern",
+        "injection_pattern",
+        id="injection-shell-operator",
+    ),
+    pytest.param(
+        "cat $(whoami)",
+        "injection_pattern",
+        "injection_pattern",
+        "injection_pattern",
+        id="injection-command-substitution",
+    ),
+    pytest.param(
+        "cat ../../etc/passwd",
+        "injection_pattern",
+        "injection_pattern",
+        "injection_pattern",
+        id="injection-directory-traversal",
+    ),
+    pytest.param(
+        "cat /dev/null",
+        "injection_pattern",
+        "injection_pattern",
+        "injection_pattern",
+        id="injection-device-access",
+    ),
+    pytest.param(
+        "ls ~",
+        "dangerous_characters",
+        None,
+        None,
+        id="dangerous-char-strict-only",
+    ),
+    pytest.param(
+        "ls café",
+        "dangerous_characters",
+        "dangerous_characters",
+        "dangerous_characters",
+        id="non-ascii",
+    ),
+    pytest.param(
+        "ls " + "a" * (VMCommandSecurityValidator.MAX_COMMAND_LENGTH + 1),
+        "excessive_length",
+        "excessive_length",
+        "excessive_length",
+        id="over-length",
+    ),
+    pytest.param(
+        "",
+        "empty_command",
+        "empty_command",
+        "empty_command",
+        id="empty",
+    ),
+    pytest.param(
+        "   ",
+        "empty_command",
+        "empty_command",
+        "empty_command",
+        id="whitespace-only",
+    ),
+]
+
+
+@pytest.mark.parametrize(("command", "strict", "standard", "permissive"), ACCEPT_REJECT_TABLE)
+def test_accept_reject_table(
+    command: str, strict: str | None, standard: str | None, permissive: str | None
+) -> None:
+    """Validate the accept/reject outcome of each command under every policy."""
+    expectations = [
+        (SecurityPolicy.STRICT, strict),
+        (SecurityPolicy.STANDARD, standard),
+        (SecurityPolicy.PERMISSIVE, permissive),
+    ]
+    for policy, expected_violation in expectations:
+        validator = VMCommandSecurityValidator(policy=policy)
+        if expected_violation is None:
+            # Must not raise
+            validator.validate_command(command)
+        else:
+            with pytest.raises(CommandSecurityError) as exc_info:
+                validator.validate_command(command)
+            assert exc_info.value.violation_type == expected_violation, (
+                f"Expected {expected_violation!r} under {policy.value} policy, "
+                f"got {exc_info.value.violation_type!r}"
+            )
+
+
+def test_unquoted_command_uses_whitespace_split() -> None:
+    """Commands without quoting are split on whitespace and pass through."""
+    validator = VMCommandSecurityValidator(policy=SecurityPolicy.STANDARD)
+    assert validator.validate_command("cat notes.txt") == "cat notes.txt"
+
+
+def test_quoted_command_matches_unquoted_equivalent() -> None:
+    """The shlex path sanitizes to the same result as the fast path."""
+    validator = VMCommandSecurityValidator(policy=SecurityPolicy.STANDARD)
+    assert validator.validate_command("cat 'notes.txt'") == validator.validate_command(
+        "cat notes.txt"
+    )
+
+
+def test_quoted_argument_preserved_through_shlex_path() -> None:
+    """Quoted arguments containing spaces survive parsing and re-quoting."""
+    validator = VMCommandSecurityValidator(policy=SecurityPolicy.STANDARD)
+    sanitized = validator.validate_command('grep "hello world" app.log')
+    assert sanitized == "grep 'hello world' app.log"
+
+
+def test_unbalanced_quote_rejected_as_invalid_syntax() -> None:
+    """Commands shlex cannot parse are rejected, not passed through."""
+    validator = VMCommandSecurityValidator(policy=SecurityPolicy.STANDARD)
+    with pytest.raises(CommandSecurityError) as exc_info:
+        validator.validate_command('cat "unterminated')
+    assert exc_info.value.violation_type == "invalid_syntax"
+
+
+def test_repeated_validation_is_stable() -> None:
+    """Memoized validations return the same sanitized command every call."""
+    validator = VMCommandSecurityValidator(policy=SecurityPolicy.STANDARD)
+    first = validator.validate_command("uptime")
+    second = validator.validate_command("uptime")
+    assert first == second == "uptime"
+
+
+def test_rejected_command_raises_on_every_call() -> None:
+    """Failures are never cached: rejected commands re-raise each time."""
+    validator = VMCommandSecurityValidator(policy=SecurityPolicy.STANDARD)
+    for _ in range(2):
+        with pytest.raises(CommandSecurityError) as exc_info:
+            validator.validate_command("sudo ls")
+        assert exc_info.value.violation_type == "blacklisted_command"